@@ -3,4 +3,7 @@ from typing import Final
 from cpg_utils.config import config_retrieve
 
 FAILURE_RATE_THRESHOLD: Final = 0.05  # 5% failure rate threshold for QC metrics
+SLACK_MAX_SGS_PER_FAILURE: Final = 10  # SG IDs listed per shared failure line in Slack
 DRAGEN_VERSION: Final = config_retrieve(['ica', 'pipelines', 'dragen_version'])
+METAMIST_UPDATE_BATCH_SIZE: Final = 50  # SG meta updates sent per metamist GraphQL request
+GCS_LISTING_WORKERS: Final = 32  # Concurrent per-SG GCS listings when gathering Dragen CSVs
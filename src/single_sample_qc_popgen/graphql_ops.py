@@ -0,0 +1,114 @@
+"""
+Metamist GraphQL documents and helpers shared by the QC jobs.
+Documents are parsed once here at import and reused for every query.
+"""
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from cpg_flow.targets import Cohort
+from loguru import logger
+from metamist.graphql import gql, query
+
+if TYPE_CHECKING:
+    from graphql import DocumentNode
+
+REPORTED_SEX_QUERY = gql(
+    """
+    query MyQuery($cohortId: String!) {
+        cohorts(id: {eq: $cohortId}) {
+            sequencingGroups {
+            id
+            sample {
+                participant {
+                    reportedSex
+                    meta
+                }
+            }
+        }
+    }
+}
+""",
+)
+
+MUTATION_DEACTIVATE_SGS = gql(
+    """
+    mutation MyMutation($sequencingGroupsToDeactivate: [String!]!) {
+        sequencingGroup {
+            archiveSequencingGroups(sequencingGroupIds: $sequencingGroupsToDeactivate) {
+            archived
+            id
+            }
+        }
+    }
+"""
+)
+
+
+@cache
+def get_update_sequencing_groups_mutation(num_sequencing_groups: int) -> 'DocumentNode':
+    """
+    Builds a mutation that updates the meta of `num_sequencing_groups` sequencing groups
+    in a single request, using one aliased updateSequencingGroup field per SG
+    (update0, update1, ...), each taking its own $sequencingGroup<i> variable.
+    Cached, as only the batch size and the final partial batch size are ever requested.
+    """
+    variable_defs = ', '.join(
+        f'$sequencingGroup{i}: SequencingGroupMetaUpdateInput!' for i in range(num_sequencing_groups)
+    )
+    update_fields = '\n'.join(
+        f'update{i}: updateSequencingGroup(project: $project, sequencingGroup: $sequencingGroup{i}) {{ id meta }}'
+        for i in range(num_sequencing_groups)
+    )
+    return gql(
+        f"""
+        mutation UpdateSequencingGroups($project: String!, {variable_defs}) {{
+            sequencingGroup {{
+                {update_fields}
+            }}
+        }}
+        """
+    )
+
+
+def get_sgid_reported_sex_mapping(cohort: Cohort) -> dict[str, int]:
+    """
+    Get a mapping of sequencing group ID to reported sex.
+    Preferentially uses 'participant_portal_reported_sex' from the
+    participant.meta field, and falls back to 'reportedSex'.
+    """
+    mapping: dict[str, int] = {}
+    response = query(REPORTED_SEX_QUERY, variables={'cohortId': cohort.id})
+    for coh in response['cohorts']:
+        for sg in coh['sequencingGroups']:
+            sg_id = sg['id']
+            participant = sg['sample']['participant']
+
+            preferred_field = None
+            participant_meta = participant.get('meta')
+
+            # 1. Check for the preferred field first
+            if isinstance(participant_meta, dict):
+                preferred_field = participant_meta.get('participant_portal_reported_sex')
+
+            # 2. If the preferred field exists, use it
+            if preferred_field is not None:
+                mapping[sg_id] = preferred_field
+
+            # 3. If not, try the fallback field
+            else:
+                fallback_field = participant.get('reportedSex')
+                if fallback_field is not None:
+                    mapping[sg_id] = fallback_field
+                    logger.warning(
+                        f"SG {sg_id}: Preferred field 'participant_portal_reported_sex' "
+                        f"not found in meta. Using field 'reportedSex' as fallback."
+                    )
+                else:
+                    # 4. If both are missing, log an error
+                    logger.error(
+                        f"SG {sg_id}: CANNOT FIND SEX. Both 'participant_portal_reported_sex' "
+                        f"and 'reportedSex' are missing or null. This SG will be "
+                        f"missing from the sex map."
+                    )
+    return mapping
@@ -8,9 +8,11 @@ a channel with:
 
 /invite @<your-app-name>
 """
-import json
+import re
 from collections import defaultdict
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
 
 import cpg_utils
 from cpg_flow.targets import Cohort
@@ -18,102 +20,138 @@ from cpg_utils import to_path
 from cpg_utils.config import config_retrieve, get_config
 from cpg_utils.slack import send_message
 from loguru import logger
-from metamist.graphql import gql, query
+import orjson
 
-from single_sample_qc_popgen.constants import FAILURE_RATE_THRESHOLD
+from single_sample_qc_popgen.constants import FAILURE_RATE_THRESHOLD, SLACK_MAX_SGS_PER_FAILURE
+from single_sample_qc_popgen.graphql_ops import get_sgid_reported_sex_mapping
 from single_sample_qc_popgen.utils import load_json
 
-REPORTED_SEX_QUERY = gql(
-    """
-    query MyQuery($cohortId: String!) {
-        cohorts(id: {eq: $cohortId}) {
-            sequencingGroups {
-            id
-            sample {
-                participant {
-                    reportedSex
-                    meta
-                }
-            }
-        }
-    }
-}
-""",
-)
+# Metamist sex code -> karyotype expected from DRAGEN ploidy estimation
+EXPECTED_PLOIDY_BY_SEX: dict[int, str] = {1: 'XY', 2: 'XX'}
 
-MUTATION_DEACTIVATE_SGS = gql(
-    """
-    mutation MyMutation($sequencingGroupsToDeactivate: [String!]!) {
-        sequencingGroup {
-            archiveSequencingGroups(sequencingGroupIds: $sequencingGroupsToDeactivate) {
-            archived
-            id
-            }
-        }
-    }
-"""
-)
 
-MUTATION_SEQUENCING_GROUP = gql(
+def calculate_ploidy(d: dict, sg_id: str, sex_mapping: dict[str, int]) -> tuple[bool | None, str, str]:
     """
-    mutation MyMutation($project: String!, $sequencingGroup: SequencingGroupMetaUpdateInput!) {
-        sequencingGroup {
-            updateSequencingGroup(project: $project, sequencingGroup: $sequencingGroup) {
-                id
-                meta
-            }
-        }
-    }
+    Validates that the DRAGEN-estimated ploidy matches the participant's reported sex.
+
+    This function performs a strict string comparison between the DRAGEN output
+    (e.g., 'XX', 'XY', 'XC', 'XXY') and the expected karyotype derived from
+    the metadata sex code (1 -> 'XY', 2 -> 'XX').
+
+    Any deviation from the strict expected string (including valid biological
+    aneuploidies like 'XXY' or 'XO') will result in a mismatch (False) to flag
+    the sample for manual review.
+
+    Returns:
+        tuple[bool | None, str, str]: A tuple containing:
+            - is_match (bool | None): True if ploidy matches expected sex exactly,
+              False if there is a mismatch, or None if metadata/metrics are missing.
+            - raw_ploidy (str): The raw string value from DRAGEN (e.g., 'XX', 'Unknown').
+            - expected_ploidy (str): The expected string (e.g., 'XY', 'XX') or error msg.
     """
-)
+    raw_ploidy = d.get('Ploidy estimation', 'Unknown')
+    expected_sex_num = sex_mapping.get(sg_id)
 
+    if expected_sex_num is None:
+        return None, raw_ploidy, f"Unknown (no sex for {sg_id})"
 
-def get_sgid_reported_sex_mapping(cohort: Cohort) -> dict[str, int]:
-    """
-    Get a mapping of sequencing group ID to reported sex.
-    Preferentially uses 'participant_portal_reported_sex' from the
-    participant.meta field, and falls back to 'reportedSex'.
-    """
-    mapping: dict[str, int] = {}
-    response = query(REPORTED_SEX_QUERY, variables={'cohortId': cohort.id})
-    for coh in response['cohorts']:
-        for sg in coh['sequencingGroups']:
-            sg_id = sg['id']
-            participant = sg['sample']['participant']
+    if raw_ploidy == 'Unknown':
+        # Uncheckable, so the caller skips it and the expected value is never logged
+        return None, raw_ploidy, 'Unknown (no ploidy estimate)'
 
-            preferred_field = None
-            participant_meta = participant.get('meta')
+    expected_ploidy = EXPECTED_PLOIDY_BY_SEX.get(expected_sex_num)
 
-            # 1. Check for the preferred field first
-            if isinstance(participant_meta, dict):
-                preferred_field = participant_meta.get('participant_portal_reported_sex')
+    # Handle cases where sex is neither 1 nor 2 (e.g. 0/Unknown)
+    if expected_ploidy is None:
+         return None, raw_ploidy, f"Ambiguous Sex Code {expected_sex_num}"
 
-            # 2. If the preferred field exists, use it
-            if preferred_field is not None:
-                mapping[sg_id] = preferred_field
+    # Strict comparison check
+    # This flags anything that isn't exactly XX or XY (e.g., XO, XXY, XYY, XXX)
+    is_match = raw_ploidy == expected_ploidy
 
-            # 3. If not, try the fallback field
-            else:
-                fallback_field = participant.get('reportedSex')
-                if fallback_field is not None:
-                    mapping[sg_id] = fallback_field
-                    logger.warning(
-                        f"SG {sg_id}: Preferred field 'participant_portal_reported_sex' "
-                        f"not found in meta. Using field 'reportedSex' as fallback."
-                    )
-                else:
-                    # 4. If both are missing, log an error
-                    logger.error(
-                        f"SG {sg_id}: CANNOT FIND SEX. Both 'participant_portal_reported_sex' "
-                        f"and 'reportedSex' are missing or null. This SG will be "
-                        f"missing from the sex map."
-                    )
-    return mapping
+    return is_match, raw_ploidy, expected_ploidy
+
+
+def calculate_chimera_rate(d: dict, _: str, __: dict) -> tuple[float | None, str, str | None]:
+    """
+    Calculator for chimera rate.
+    Returns: (value_to_check, raw_value_for_log, expected_value_for_log)
+    """
+    chimeric = d.get('Supplementary (chimeric) alignments')
+    total = d.get('Total alignments')
+    # Missing counts or no alignments, so the rate can't be calculated
+    if chimeric is None or not total:
+        return None, "N/A", None
+    val = chimeric / total
+    # No raw value or expected value, so return val and None
+    return val, f"{val:.4f}", None
+
+
+QC_MAPPING: dict[str, dict[str, Any]] = {
+    'mean_coverage': {
+        'multiqc_report_name': 'Average sequenced coverage over genome',
+        'display_name': 'Mean Coverage',
+    },
+    'ploidy_estimation': {
+        'calculator': calculate_ploidy,
+        'multiqc_report_name': 'Ploidy estimation',
+        'display_name': 'Ploidy Estimation',
+    },
+    'pct_genome_gt_20x': {
+        'multiqc_report_name': 'wgs pct of genome with coverage [20x:inf)',
+        'display_name': 'Pct Genome @ >20x',
+    },
+    'q30_bases': {
+        'multiqc_report_name': 'Q30 bases',
+        'display_name': 'Q30 Bases',
+    },
+    'q30_bases_pct': {
+        'multiqc_report_name': 'Q30 bases pct',
+        'display_name': 'Q30 Bases (%)',
+    },
+    'contamination_verifybamid': {
+        'multiqc_report_name': 'FREEMIX',
+        'display_name': 'Contamination (VerifyBamID)',
+    },
+    'contamination_dragen': {
+        'multiqc_report_name': 'Estimated sample contamination',
+        'display_name': 'Contamination (DRAGEN)',
+    },
+    'mapping_rate_pct': {
+        'multiqc_report_name': 'Mapped reads pct',
+        'display_name': 'Mapping Rate (%)',
+    },
+    'duplication_rate_pct': {
+        'multiqc_report_name': 'Number of duplicate marked reads pct',
+        'display_name': 'Duplication Rate (%)',
+    },
+    'chimera_rate': {
+        'calculator': calculate_chimera_rate,
+        'display_name': 'Chimera Rate',
+    },
+    'mean_insert_size': {
+        'multiqc_report_name': 'Insert length: mean',
+        'display_name': 'Mean Insert Size',
+    },
+    'insert_size_sd': {
+        'multiqc_report_name': 'Insert length: standard deviation',
+        'display_name': 'Insert Size SD',
+    },
+    'ti_tv_ratio': {
+        'multiqc_report_name': 'Ti/Tv ratio',
+        'display_name': 'Ti/Tv Ratio (SNPs)',
+    },
+    'het_hom_ratio': {
+        'multiqc_report_name': 'Het/Hom ratio',
+        'display_name': 'Het/Hom Ratio',
+    },
+}
 
 
 class QCChecker:
     """
-    Encapsulates all logic for checking a MultiQC report for a cohort.
+    Holds the per-run state for checking a MultiQC report for a cohort.
+    The metric definitions and calculators are shared via the module-level QC_MAPPING.
     """
     # Now accepts multiqc_data directly, rather than finding it itself
     def __init__(self, cohort: Cohort, multiqc_data: dict, output: cpg_utils.Path):
@@ -122,124 +160,14 @@ class QCChecker:
         self.cohort_sgs = self.cohort.get_sequencing_groups()
         self.sex_mapping = get_sgid_reported_sex_mapping(self.cohort)
         self.multiqc_data = multiqc_data
-        self.QC_MAPPING: dict[str, dict[str, Any]] = {
-            'mean_coverage': {
-                'multiqc_report_name': 'Average sequenced coverage over genome',
-                'display_name': 'Mean Coverage',
-            },
-            'ploidy_estimation': {
-                'calculator': self._calculate_ploidy,
-                'multiqc_report_name': 'Ploidy estimation',
-                'display_name': 'Ploidy Estimation',
-            },
-            'pct_genome_gt_20x': {
-                'multiqc_report_name': 'wgs pct of genome with coverage [20x:inf)',
-                'display_name': 'Pct Genome @ >20x',
-            },
-            'q30_bases': {
-                'multiqc_report_name': 'Q30 bases',
-                'display_name': 'Q30 Bases',
-            },
-            'q30_bases_pct': {
-                'multiqc_report_name': 'Q30 bases pct',
-                'display_name': 'Q30 Bases (%)',
-            },
-            'contamination_verifybamid': {
-                'multiqc_report_name': 'FREEMIX',
-                'display_name': 'Contamination (VerifyBamID)',
-            },
-            'contamination_dragen': {
-                'multiqc_report_name': 'Estimated sample contamination',
-                'display_name': 'Contamination (DRAGEN)',
-            },
-            'mapping_rate_pct': {
-                'multiqc_report_name': 'Mapped reads pct',
-                'display_name': 'Mapping Rate (%)',
-            },
-            'duplication_rate_pct': {
-                'multiqc_report_name': 'Number of duplicate marked reads pct',
-                'display_name': 'Duplication Rate (%)',
-            },
-            'chimera_rate': {
-                'calculator': self._calculate_chimera_rate,
-                'display_name': 'Chimera Rate',
-            },
-            'mean_insert_size': {
-                'multiqc_report_name': 'Insert length: mean',
-                'display_name': 'Mean Insert Size',
-            },
-            'insert_size_sd': {
-                'multiqc_report_name': 'Insert length: standard deviation',
-                'display_name': 'Insert Size SD',
-            },
-            'ti_tv_ratio': {
-                'multiqc_report_name': 'Ti/Tv ratio',
-                'display_name': 'Ti/Tv Ratio (SNPs)',
-            },
-            'het_hom_ratio': {
-                'multiqc_report_name': 'Het/Hom ratio',
-                'display_name': 'Het/Hom Ratio',
-            },
-        }
-
-    def _calculate_ploidy(self, d: dict, sg_id: str, sex_mapping: dict[str, int]) -> tuple[bool | None, str, str]:
-        """
-        Validates that the DRAGEN-estimated ploidy matches the participant's reported sex.
-
-        This method performs a strict string comparison between the DRAGEN output
-        (e.g., 'XX', 'XY', 'XC', 'XXY') and the expected karyotype derived from
-        the metadata sex code (1 -> 'XY', 2 -> 'XX').
-
-        Any deviation from the strict expected string (including valid biological
-        aneuploidies like 'XXY' or 'XO') will result in a mismatch (False) to flag
-        the sample for manual review.
-
-        Returns:
-            tuple[bool | None, str, str]: A tuple containing:
-                - is_match (bool | None): True if ploidy matches expected sex exactly,
-                  False if there is a mismatch, or None if metadata/metrics are missing.
-                - raw_ploidy (str): The raw string value from DRAGEN (e.g., 'XX', 'Unknown').
-                - expected_ploidy (str): The expected string (e.g., 'XY', 'XX') or error msg.
-        """
-        raw_ploidy = d.get('Ploidy estimation', 'Unknown')
-        expected_sex_num = sex_mapping.get(sg_id)
 
-        if expected_sex_num is None:
-            return None, raw_ploidy, f"Unknown (no sex for {sg_id})"
 
-        if raw_ploidy == 'Unknown':
-            return None, raw_ploidy, str(expected_sex_num)
-
-        expected_ploidy = 'XY' if expected_sex_num == 1 else 'XX'
-
-        # Handle cases where sex is neither 1 nor 2 (e.g. 0/Unknown)
-        if expected_sex_num not in [1, 2]:
-             return None, raw_ploidy, f"Ambiguous Sex Code {expected_sex_num}"
-
-        # Strict comparison check
-        # This flags anything that isn't exactly XX or XY (e.g., XO, XXY, XYY, XXX)
-        is_match = raw_ploidy == expected_ploidy
-
-        return is_match, raw_ploidy, expected_ploidy
-
-    def _calculate_chimera_rate(
-        self, d: dict, _: str, __: dict
-    ) -> tuple[float | None, str, str | None]:
-        """
-        Calculator for chimera rate.
-        Returns: (value_to_check, raw_value_for_log, expected_value_for_log)
-        """
-        try:
-            val = d['Supplementary (chimeric) alignments'] / d['Total alignments']
-            # No raw value or expected value, so return val and None
-            return val, f"{val:.4f}", None
-        except (KeyError, ZeroDivisionError, TypeError):
-            return None, "N/A", None
-
-
-def build_qc_thresholds(seq_type: str, config_key: str, qc_checker: QCChecker) -> dict[str, dict]:
+def build_qc_thresholds(threshold_config: dict, config_key: str, sex_mapping: dict[str, int]) -> dict[str, dict]:
     """
     Build a dictionary of desired QC thresholds from config.
+    `threshold_config` is the already-resolved qc_thresholds.<seq_type> section,
+    so the config is only walked once per run rather than once per check type.
+    Each entry carries an 'extract' callable from get_metric_extractor.
     Example config structure:
         [qc_thresholds.genome.min]
         mean_coverage = 30
@@ -250,77 +178,152 @@ def build_qc_thresholds(seq_type: str, config_key: str, qc_checker: QCChecker) -
         [qc_thresholds.genome.equality]
         ploidy_estimation = True
     """
-    threshold_d = get_config()['qc_thresholds'].get(seq_type, {}).get(config_key, {})
+    threshold_d = threshold_config.get(config_key, {})
     qc_thresholds = {}
     for metric, threshold in threshold_d.items():
-        if metric in qc_checker.QC_MAPPING:
+        if (metric_mapping := QC_MAPPING.get(metric)) is not None:
             qc_thresholds[metric] = {
                 'threshold': threshold,
-                **qc_checker.QC_MAPPING[metric],
+                **metric_mapping,
             }
         else:
             logger.warning(
                 f"Metric '{metric}' has a threshold but is not defined in QC_MAPPING. "
                 f"Using default names."
-                f"Default names are the following: {list(qc_checker.QC_MAPPING.keys())}"
+                f"Default names are the following: {list(QC_MAPPING.keys())}"
             )
             qc_thresholds[metric] = {
                 'threshold': threshold,
                 'multiqc_report_name': metric,
                 'display_name': metric,
             }
+        qc_thresholds[metric]['extract'] = get_metric_extractor(qc_thresholds[metric], sex_mapping)
     return qc_thresholds
 
-def get_metric_value(
-        qc_checker: QCChecker,
+def merge_multiqc_sections(multiqc_data: dict[str, dict]) -> dict[str, dict]:
+    """
+    Flattens report_general_stats_data ({module: {sg_id: {metric: value}}}) into
+    a single {sg_id: {metric: value}} table, so each sample is checked once
+    rather than once per MultiQC module it appears in.
+    """
+    metrics_by_sg: dict[str, dict] = defaultdict(dict)
+    for section_data in multiqc_data.values():
+        for sg_id, val_by_metric in section_data.items():
+            metrics_by_sg[sg_id].update(val_by_metric)
+    return metrics_by_sg
+
+def drop_unreported_metrics(threshold_map: dict[str, dict], reported_metrics: set[str]) -> dict[str, dict]:
+    """
+    Removes direct-lookup metrics that no sample has in the MultiQC report, so
+    they are skipped once here instead of missing on every SG in the scan.
+    Calculator metrics are kept, as they derive their value from other fields.
+    """
+    checked_metrics = {}
+    for metric, metric_config in threshold_map.items():
+        if 'calculator' not in metric_config and metric_config['multiqc_report_name'] not in reported_metrics:
+            logger.warning(
+                f"Metric '{metric}' has a threshold but '{metric_config['multiqc_report_name']}' "
+                f"is not in the MultiQC report for any sample. Skipping."
+            )
+            continue
+        checked_metrics[metric] = metric_config
+    return checked_metrics
+
+def get_metric_extractor(
         metric_config: dict,
-        val_by_metric: dict,
-        sg_id: str,
-    ) -> tuple[Any, str, str | None]:
+        sex_mapping: dict[str, int],
+    ) -> Callable[[dict, str], tuple[Any, Any, str | None]]:
         """
-        Gets the metric value, either from a calculator or direct lookup.
-        Returns: (value_to_check, raw_value_for_log, expected_value_for_log)
+        Resolves once per metric whether its value comes from a calculator or a
+        direct lookup, so the per-sample loop only has to call the result.
+        The returned callable takes (val_by_metric, sg_id) and returns
+        (value_to_check, raw_value_for_log, expected_value_for_log).
         """
         if 'calculator' in metric_config:
             # Use the calculator function
-            return metric_config['calculator'](
-                val_by_metric, sg_id, qc_checker.sex_mapping
-            )
+            calculator = metric_config['calculator']
+            return lambda val_by_metric, sg_id: calculator(val_by_metric, sg_id, sex_mapping)
 
         # Default: Direct lookup
-        val = val_by_metric.get(metric_config['multiqc_report_name'])
-        return val, str(val), None
+        report_name = metric_config['multiqc_report_name']
+
+        def lookup(val_by_metric: dict, _: str) -> tuple[Any, Any, None]:
+            val = val_by_metric.get(report_name)
+            # The raw value is only stringified if a log line is formatted with it
+            return val, val, None
+
+        return lookup
+
+class QcCheck(NamedTuple):
+    """One configured metric check, with everything the per-sample loop needs pre-resolved."""
+
+    display_name: str
+    threshold: Any
+    extract: Callable[[dict, str], tuple[Any, Any, str | None]]
+    is_fail: Callable[[Any, Any], bool]
+    format_line: Callable[..., str]
+    fail_sign: str
+    good_sign: str
+
+# Log line templates, bound once rather than re-building an f-string for every check
+_format_bool_line = '{0} is {1} (expected {2})'.format
+_format_numeric_line = '{0}={1:.4f} {2} {3:.4f}'.format
+_format_raw_line = '{0}={1} {2} {3}'.format
+_format_sg_line = '{0} {1}: {2}'.format
 
-def format_log_line(
+
+def format_threshold_line(
         display_name: str,
         val_to_check: Any,
         threshold: Any,
         sign: str,
-        check_type: str,
-        raw_val_for_log: str,
-        expected_val_for_log: str | None,
+        raw_val_for_log: Any,  # noqa: ARG001
+        expected_val_for_log: str | None,  # noqa: ARG001
     ) -> str:
-        """Formats the log line based on the check type."""
-        if check_type == 'equality' and isinstance(val_to_check, bool):
-            # Special format for boolean checks (like ploidy)
-            return (
-                f'{display_name} is {raw_val_for_log} '
-                f'(expected {expected_val_for_log})'
-            )
+        """Formats the log line for a min/max check."""
         # Standard format for numeric checks
         try:
-            return f'{display_name}={val_to_check:.4f} {sign} {threshold:.4f}'
+            return _format_numeric_line(display_name, val_to_check, sign, threshold)
         except (ValueError, TypeError):
             # Fallback for non-numeric values
-            return f'{display_name}={val_to_check} {sign} {threshold}'
+            return _format_raw_line(display_name, val_to_check, sign, threshold)
+
+def format_equality_line(
+        display_name: str,
+        val_to_check: Any,
+        threshold: Any,
+        sign: str,
+        raw_val_for_log: Any,
+        expected_val_for_log: str | None,
+    ) -> str:
+        """Formats the log line for an equality check."""
+        if isinstance(val_to_check, bool):
+            # Special format for boolean checks (like ploidy)
+            return _format_bool_line(display_name, raw_val_for_log, expected_val_for_log)
+        return format_threshold_line(
+            display_name, val_to_check, threshold, sign, raw_val_for_log, expected_val_for_log
+        )
 
 def write_failures_to_json(bad_lines_by_sample: dict[str, list[str]], output: cpg_utils.Path) -> None:
         """Writes all failed sample logs to a JSON file."""
         logger.warning(
             f'Writing {len(bad_lines_by_sample)} failed sample(s) to {output}'
         )
-        with to_path(output).open('w') as f:
-                json.dump(bad_lines_by_sample, f, indent=4)
+        with to_path(output).open('wb') as f:
+                f.write(orjson.dumps(bad_lines_by_sample, option=orjson.OPT_INDENT_2))
+
+def group_failures_by_metrics(bad_lines_by_sample: dict[str, list[str]]) -> dict[tuple[str, ...], list[str]]:
+    """
+    Groups failed SGs by the set of metrics they failed, e.g.
+    {('Mapping Rate (%)', 'Chimera Rate'): ['CPG1', 'CPG2']}.
+    The metric display name is the part of each log line before '=' (numeric
+    checks) or ' is ' (boolean checks).
+    """
+    sgs_by_failed_metrics: dict[tuple[str, ...], list[str]] = defaultdict(list)
+    for sg_id, bad_lines in bad_lines_by_sample.items():
+        failed_metrics = tuple(re.split(r'=| is ', line, maxsplit=1)[0] for line in bad_lines)
+        sgs_by_failed_metrics[failed_metrics].append(sg_id)
+    return sgs_by_failed_metrics
 
 def post_to_slack(bad_lines_by_sample: dict[str, list[str]], qc_checker: QCChecker, html_url: str) -> None:
     """Constructs and sends the final Slack message."""
@@ -348,8 +351,15 @@ def post_to_slack(bad_lines_by_sample: dict[str, list[str]], qc_checker: QCCheck
 
     if num_failed > 0:
         messages.append(f'{title}. {num_failed} samples are flagged:')
-        for sg_id, bad_lines in bad_lines_by_sample.items():
-            messages.append(f'❗ {sg_id}: ' + ', '.join(bad_lines))
+        # Samples failing the same set of metrics share one line, full details are in the failures JSON
+        for failed_metrics, sg_ids in group_failures_by_metrics(bad_lines_by_sample).items():
+            if len(sg_ids) == 1:
+                messages.append(f'❗ {sg_ids[0]}: ' + ', '.join(bad_lines_by_sample[sg_ids[0]]))
+                continue
+            shown_sgs = ', '.join(sg_ids[:SLACK_MAX_SGS_PER_FAILURE])
+            if len(sg_ids) > SLACK_MAX_SGS_PER_FAILURE:
+                shown_sgs += f' (+{len(sg_ids) - SLACK_MAX_SGS_PER_FAILURE} more)'
+            messages.append(f'❗ {len(sg_ids)} samples failing [{", ".join(failed_metrics)}]: {shown_sgs}')
     else:
         messages.append(f'✅ {title}')
 
@@ -381,71 +391,101 @@ def run(
         )
     qc_checker = QCChecker(cohort, multiqc_data, output)
 
-    seq_type = get_config()['workflow']['sequencing_type']
+    config = get_config()
+    seq_type = config['workflow']['sequencing_type']
+    threshold_config = config['qc_thresholds'].get(seq_type, {})
+
+    # Scan one row of metrics per SG instead of every MultiQC module separately
+    metrics_by_sg = merge_multiqc_sections(qc_checker.multiqc_data)
+    reported_metrics = set().union(*metrics_by_sg.values())
 
     # Run checks
-    bad_lines_by_sample = defaultdict(list)
+    bad_lines_by_sample: dict[str, list[str]] = {}
+    good_lines_by_sample: dict[str, list[str]] = {}
+    # The line formatter is fixed per check type, so it is picked here rather than per check
     check_definitions =  [
-        ('min', '<', '≥', lambda val, thresh: val < thresh),
-        ('max', '>', '≤', lambda val, thresh: val > thresh),
-        ('equality', '!=', '==', lambda val, thresh: val != thresh),
+        ('min', '<', '≥', lambda val, thresh: val < thresh, format_threshold_line),
+        ('max', '>', '≤', lambda val, thresh: val > thresh, format_threshold_line),
+        ('equality', '!=', '==', lambda val, thresh: val != thresh, format_equality_line),
     ]
-    for check_type, fail_sign, good_sign, is_fail in check_definitions:
-        # 1. Build thresholds for this check type (min, max, or equality)
-        threshold_map = build_qc_thresholds(seq_type, check_type, qc_checker)
-
-        # 2. Iterate through MultiQC data sections
-        for section_data in qc_checker.multiqc_data.values():
-            # 3. Iterate through each sample in the section
-            for sg_id, val_by_metric in section_data.items():
-                # 4. Iterate through each metric to check
-                for metric_config in threshold_map.values():
-                    # 5. Get the value for the metric
-                    # DRAGEN does not provide pct chimeras directly, so we calculate it
-                    # Also, ploidy estimation needs custom calculation
-                    (
-                        val_to_check,
-                        raw_val_for_log,
-                        expected_val_for_log,
-                    ) = get_metric_value(qc_checker, metric_config, val_by_metric, sg_id)
-
-                    if val_to_check is None:
-                        # Metric not found or calculation failed
-                        continue
-
-                    threshold = metric_config['threshold']
-                    display_name = metric_config['display_name']
-
-                    # 6. Perform the check
-                    if is_fail(val_to_check, threshold):
-                        # --- FAILURE ---
-                        sign = fail_sign
-                        is_failure = True
-                    else:
-                        # --- SUCCESS ---
-                        sign = good_sign
-                        is_failure = False
-
-                     # 7. Format and log the result
-                    line = format_log_line(
-                        display_name,
-                        val_to_check,
-                        threshold,
-                        sign,
-                        check_type,
-                        raw_val_for_log,
-                        expected_val_for_log,
-                    )
-
-                    if is_failure:
-                        logger.warning(f'❗ {sg_id}: {line}')
-                        bad_lines_by_sample[sg_id].append(line)
-                    else:
-                        logger.info(f'✅ {sg_id}: {line}')
+    # 1. Build thresholds for every check type (min, max, and equality) into one list of checks,
+    # so each sample is visited once rather than once per check type
+    checks: list[QcCheck] = []
+    for check_type, fail_sign, good_sign, is_fail, format_line in check_definitions:
+        threshold_map = build_qc_thresholds(threshold_config, check_type, qc_checker.sex_mapping)
+        if not threshold_map:
+            # No thresholds configured for this check type
+            continue
+        threshold_map = drop_unreported_metrics(threshold_map, reported_metrics)
+        checks.extend(
+            QcCheck(
+                metric_config['display_name'],
+                metric_config['threshold'],
+                metric_config['extract'],
+                is_fail,
+                format_line,
+                fail_sign,
+                good_sign,
+            )
+            for metric_config in threshold_map.values()
+        )
+
+    if not checks:
+        logger.warning(f'No QC thresholds to check for {seq_type}. Skipping QC checks.')
+        return
+
+    # 2. Iterate through each sample's merged metrics
+    for sg_id, val_by_metric in metrics_by_sg.items():
+        # 3. Iterate through each metric to check
+        for check in checks:
+            # 4. Get the value for the metric
+            # DRAGEN does not provide pct chimeras directly, so we calculate it
+            # Also, ploidy estimation needs custom calculation
+            (
+                val_to_check,
+                raw_val_for_log,
+                expected_val_for_log,
+            ) = check.extract(val_by_metric, sg_id)
+
+            if val_to_check is None:
+                # Metric not found or calculation failed
+                continue
+
+            threshold = check.threshold
+
+            # 5. Perform the check
+            is_failure = check.is_fail(val_to_check, threshold)
+
+            # 6. Format and record the result, logging is deferred until after the scan
+            line = check.format_line(
+                check.display_name,
+                val_to_check,
+                threshold,
+                check.fail_sign if is_failure else check.good_sign,
+                raw_val_for_log,
+                expected_val_for_log,
+            )
+
+            if is_failure:
+                bad_lines_by_sample.setdefault(sg_id, []).append(line)
+            else:
+                good_lines_by_sample.setdefault(sg_id, []).append(line)
+
+    # One log call per SG, rather than one per metric check
+    log_info = logger.info
+    log_warning = logger.warning
+    for sg_id, good_lines in good_lines_by_sample.items():
+        log_info(_format_sg_line('✅', sg_id, ', '.join(good_lines)))
+    for sg_id, bad_lines in bad_lines_by_sample.items():
+        log_warning(_format_sg_line('❗', sg_id, ', '.join(bad_lines)))
 
     logger.info('') # Newline for readability
 
     # --- Post-checking steps ---
     if bad_lines_by_sample:
-        write_failures_to_json(bad_lines_by_sample, output)
-        post_to_slack(bad_lines_by_sample, qc_checker, html_url)
+        # The GCS write and the Slack post are independent, so overlap the two round trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            write_future = executor.submit(write_failures_to_json, bad_lines_by_sample, output)
+            slack_future = executor.submit(post_to_slack, bad_lines_by_sample, qc_checker, html_url)
+            write_future.result()
+            slack_future.result()
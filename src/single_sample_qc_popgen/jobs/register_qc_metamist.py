@@ -4,177 +4,133 @@ Options to deactivate sequencing groups that failed QC.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import cpg_utils
 from cpg_flow.targets import Cohort, SequencingGroup
 from cpg_utils.config import config_retrieve
 from loguru import logger
-from metamist.graphql import gql, query
+from metamist.graphql import query
 
+from single_sample_qc_popgen.constants import METAMIST_UPDATE_BATCH_SIZE
+from single_sample_qc_popgen.graphql_ops import MUTATION_DEACTIVATE_SGS, get_update_sequencing_groups_mutation
 from single_sample_qc_popgen.utils import load_json
 
-REPORTED_SEX_QUERY = gql(
-    """
-    query MyQuery($cohortId: String!) {
-        cohorts(id: {eq: $cohortId}) {
-            sequencingGroups {
-            id
-            sample {
-                participant {
-                    reportedSex
-                }
-            }
-        }
-    }
-}
-""",
-)
-
-MUTATION_DEACTIVATE_SGS = gql(
-    """
-    mutation MyMutation($sequencingGroupsToDeactivate: [String!]!) {
-        sequencingGroup {
-            archiveSequencingGroups(sequencingGroupIds: $sequencingGroupsToDeactivate) {
-            archived
-            id
-            }
-        }
-    }
-"""
-)
-
-MUTATION_SEQUENCING_GROUP = gql(
-    """
-    mutation MyMutation($project: String!, $sequencingGroup: SequencingGroupMetaUpdateInput!) {
-        sequencingGroup {
-            updateSequencingGroup(project: $project, sequencingGroup: $sequencingGroup) {
-                id
-                meta
-            }
-        }
-    }
-    """
+# (meta key, MultiQC module, MultiQC metric name) for each metric registered in metamist
+MULTIQC_METRIC_MAP: tuple[tuple[str, str, str], ...] = (
+    # Contamination
+    ('freemix', 'verifybamid', 'FREEMIX'),
+    ('contamination_dragen', 'DRAGEN', 'Estimated sample contamination'),
+
+    # Coverage & Yield
+    ('mean_coverage', 'DRAGEN', 'Average sequenced coverage over genome'),
+    ('median_coverage', 'DRAGEN_5', 'wgs median autosomal coverage over genome'),
+    ('pct_genome_gt_20x', 'DRAGEN_5', 'wgs pct of genome with coverage [20x:inf)'),
+    ('q30_bases_pct', 'DRAGEN', 'Q30 bases pct'),
+
+    # Alignment & Library Quality
+    ('mapping_rate_pct', 'DRAGEN', 'Mapped reads pct'),
+    ('pct_duplicate_reads', 'DRAGEN', 'Number of duplicate marked reads pct'),
+    ('mean_insert_size', 'DRAGEN', 'Insert length: mean'),
+    ('std_dev_insert_size', 'DRAGEN', 'Insert length: standard deviation'),
+    ('avg_gc_content', 'dragen-fastqc', 'avg_gc_content_percent'),
+    ('chimera_alignments', 'DRAGEN', 'Supplementary (chimeric) alignments'),
+    ('total_alignments', 'DRAGEN', 'Total alignments'),
+
+    # Sex & Ploidy
+    ('ploidy_estimation', 'DRAGEN_4', 'Ploidy estimation'),
+    ('norm_x_coverage', 'DRAGEN_4', 'X median / Autosomal median'),
+    ('norm_y_coverage', 'DRAGEN_4', 'Y median / Autosomal median'),
+
+    # Variant QC
+    ('ti_tv_ratio', 'DRAGEN_3', 'Ti/Tv ratio'),
+    ('het_hom_ratio', 'DRAGEN_3', 'Het/Hom ratio'),
 )
 
+# MULTIQC_METRIC_MAP grouped by MultiQC module as {module: [(meta key, metric name)]},
+# so each module section is looked up once per SG scan
+MULTIQC_METRICS_BY_TOOL: dict[str, list[tuple[str, str]]] = {}
+for _out_key, _tool_key, _metric_key in MULTIQC_METRIC_MAP:
+    MULTIQC_METRICS_BY_TOOL.setdefault(_tool_key, []).append((_out_key, _metric_key))
 
-def get_sgid_reported_sex_mapping(cohort: Cohort) -> dict[str, int]:
-    """
-    Get a mapping of sequencing group ID to reported sex.
-    """
-    mapping: dict[str, int] = {}
-    response = query(REPORTED_SEX_QUERY, variables={'cohortId': cohort.id})
-    for coh in response['cohorts']:
-        for sg in coh   ['sequencingGroups']:
-            mapping[sg['id']] = sg['sample']['participant']['reportedSex']
-    return mapping
+# Meta keys in MULTIQC_METRIC_MAP order
+MULTIQC_META_KEYS: tuple[str, ...] = tuple(out_key for out_key, _, _ in MULTIQC_METRIC_MAP)
 
 def build_sg_multiqc_meta_dict(cohort_sgs: list[SequencingGroup], multiqc_json: dict[str, Any]) -> dict[str, dict]:
     """
     Build a dictionary mapping sequencing group IDs to their MultiQC metrics.
+    Metrics are pulled one MultiQC module at a time, so each module's section is
+    looked up once rather than once per sequencing group and metric.
     """
-    metric_map = [
-        # Contamination
-        ('freemix', 'verifybamid', 'FREEMIX'),
-        ('contamination_dragen', 'DRAGEN', 'Estimated sample contamination'),
-
-        # Coverage & Yield
-        ('mean_coverage', 'DRAGEN', 'Average sequenced coverage over genome'),
-        ('median_coverage', 'DRAGEN_5', 'wgs median autosomal coverage over genome'),
-        ('pct_genome_gt_20x', 'DRAGEN_5', 'wgs pct of genome with coverage [20x:inf)'),
-        ('q30_bases_pct', 'DRAGEN', 'Q30 bases pct'),
-
-        # Alignment & Library Quality
-        ('mapping_rate_pct', 'DRAGEN', 'Mapped reads pct'),
-        ('pct_duplicate_reads', 'DRAGEN', 'Number of duplicate marked reads pct'),
-        ('mean_insert_size', 'DRAGEN', 'Insert length: mean'),
-        ('std_dev_insert_size', 'DRAGEN', 'Insert length: standard deviation'),
-        ('avg_gc_content', 'dragen-fastqc', 'avg_gc_content_percent'),
-        ('chimera_alignments', 'DRAGEN', 'Supplementary (chimeric) alignments'),
-        ('total_alignments', 'DRAGEN', 'Total alignments'),
-
-        # Sex & Ploidy
-        ('ploidy_estimation', 'DRAGEN_4', 'Ploidy estimation'),
-        ('norm_x_coverage', 'DRAGEN_4', 'X median / Autosomal median'),
-        ('norm_y_coverage', 'DRAGEN_4', 'Y median / Autosomal median'),
-
-        # Variant QC
-        ('ti_tv_ratio', 'DRAGEN_3', 'Ti/Tv ratio'),
-        ('het_hom_ratio', 'DRAGEN_3', 'Het/Hom ratio'),
-    ]
-
-    extracted_data = {}
-
-    for sg in cohort_sgs:
-        sample_metrics: dict[str, Any] = {}
-        missing_tools_for_this_sample = set()
-
-        for out_key, tool_key, metric_key in metric_map:
-            # Check tool key exists
-            if tool_key not in multiqc_json:
-                sample_metrics[out_key] = None
-                continue
-
-            # Extract metric values for sequencing group, handle missing keys
-            if sg.id not in multiqc_json[tool_key]:
-                sample_metrics[out_key] = None
-                # Only log if we haven't complained about this specific tool for this sample yet
-                if tool_key not in missing_tools_for_this_sample:
-                    logger.warning(f"⚠️ Sequencing Group '{sg.id}' missing from MultiQC module: '{tool_key}'")
-                    missing_tools_for_this_sample.add(tool_key)
+    # Every metric defaults to None, keeping the meta keys in MULTIQC_METRIC_MAP order
+    extracted_data: dict[str, dict[str, Any]] = {sg.id: dict.fromkeys(MULTIQC_META_KEYS) for sg in cohort_sgs}
+
+    for tool_key, metrics in MULTIQC_METRICS_BY_TOOL.items():
+        tool_dict = multiqc_json.get(tool_key)
+        if tool_dict is None:
+            continue
+
+        for sg_id, sample_metrics in extracted_data.items():
+            sg_tool_metrics = tool_dict.get(sg_id)
+            if sg_tool_metrics is None:
+                logger.warning(f"⚠️ Sequencing Group '{sg_id}' missing from MultiQC module: '{tool_key}'")
                 continue
-
-            try:
-                value = multiqc_json[tool_key][sg.id][metric_key]
-                sample_metrics[out_key] = value
-            except (KeyError, TypeError):
-                # Use None if the metric is missing for this sample
-                sample_metrics[out_key] = None
-
-        extracted_data[sg.id] = sample_metrics
+            for out_key, metric_key in metrics:
+                sample_metrics[out_key] = sg_tool_metrics.get(metric_key)
 
     return extracted_data
 
+
 def update_sg_qc_metrics(
         failed_samples: dict[str, list[str]],
-        meta_to_update: dict[str, Any],
+        multiqc_data: dict[str, Any],
         cohort: Cohort,
         output: cpg_utils.Path
     ) -> dict[str, list[str]]:
     cohort_sgs: list[SequencingGroup] = cohort.get_sequencing_groups()
-    meta_to_update = build_sg_multiqc_meta_dict(cohort_sgs, meta_to_update)
+    meta_to_update = build_sg_multiqc_meta_dict(cohort_sgs, multiqc_data)
     if not failed_samples:
         logger.info('No failed samples detected for this cohort QC run.')
     else:
         logger.warning(f'Failed samples: {failed_samples}')
-    logger.info(f'meta to update: {meta_to_update}')
+    # Per-SG details are debug-level, and passed as args so loguru only formats them if emitted
+    logger.debug('meta to update: {}', meta_to_update)
+    sg_updates = []
+    registered_meta: dict[str, dict[str, Any]] = {}
     for sg in cohort_sgs:
-        sg_meta ={}
-        sg_meta['qc'] = meta_to_update.get(sg.id, {})
-        sg_meta['qc']['qc_checks_failed'] = failed_samples.get(sg.id, []) if sg.id in failed_samples else []
-        logger.info(f'Updating SG {sg.id} with meta: {sg_meta}')
+        sg_qc = {**meta_to_update.get(sg.id, {}), 'qc_checks_failed': failed_samples.get(sg.id, [])}
+        registered_meta[sg.id] = sg_qc
+        sg_meta = {'qc': sg_qc}
+        logger.debug('Updating SG {} with meta: {}', sg.id, sg_meta)
+        sg_updates.append({'id': sg.id, 'meta': sg_meta})
+
+    # One request per batch of SGs rather than one per SG
+    project = f'{cohort.dataset.name}-test'
+    for batch_start in range(0, len(sg_updates), METAMIST_UPDATE_BATCH_SIZE):
+        batch = sg_updates[batch_start : batch_start + METAMIST_UPDATE_BATCH_SIZE]
         result_update_mutation = query(
-            MUTATION_SEQUENCING_GROUP,
+            get_update_sequencing_groups_mutation(len(batch)),
             variables={
-                'project': f'{cohort.dataset.name}-test',
-                'sequencingGroup': {
-                    'id': sg.id,
-                    'meta': sg_meta,
-                },
+                'project': project,
+                **{f'sequencingGroup{i}': sg_update for i, sg_update in enumerate(batch)},
             },
-        )
-        logger.info(f'Updated SG {sg.id}: {result_update_mutation}')
+        )['sequencingGroup']
+        for i, sg_update in enumerate(batch):
+            logger.debug('Updated SG {}: {}', sg_update['id'], result_update_mutation[f'update{i}'])
+    logger.info(f'Updated QC meta for {len(sg_updates)} sequencing groups in {project}')
 
     # Write out meta fields updated to json
     with output.open('w') as f:
-        json.dump(meta_to_update, f, indent=4)
+        json.dump(registered_meta, f, indent=4)
 
     # Deactivate sequencing groups that failed QC
     if config_retrieve(['workflow', 'multiqc']).get('deactivate_sgs', False):
-        logger.warning(f'Deactivating failed samples: {list(failed_samples.keys())}')
+        failed_ids = list(failed_samples)
+        logger.warning(f'Deactivating failed samples: {failed_ids}')
         result_mutation = query(
             MUTATION_DEACTIVATE_SGS,
-            variables={'sequencingGroupsToDeactivate': list(failed_samples.keys())},
+            variables={'sequencingGroupsToDeactivate': failed_ids},
         )['sequencingGroup']['archiveSequencingGroups']
         logger.warning(f'Deactivated sequencing groups: {result_mutation}')
 
@@ -187,18 +143,24 @@ def run(
     output: cpg_utils.Path,
 ):
 
-    multiqc_data = load_json(
-        multiqc_data_path,
-        extract_key='report_general_stats_data'
-    )
-    failed_samples = load_json(
-        failed_samples_path,
-        allow_missing=True,
-    )
+    # Both reads are GCS round trips, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        multiqc_data_future = executor.submit(
+            load_json,
+            multiqc_data_path,
+            extract_key='report_general_stats_data',
+        )
+        failed_samples_future = executor.submit(
+            load_json,
+            failed_samples_path,
+            allow_missing=True,
+        )
+        multiqc_data = multiqc_data_future.result()
+        failed_samples = failed_samples_future.result()
 
     update_sg_qc_metrics(
         failed_samples=failed_samples,
-        meta_to_update=multiqc_data,
+        multiqc_data=multiqc_data,
         cohort=cohort,
         output=output,
     )
@@ -3,17 +3,36 @@ Batch jobs to run MultiQC.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from cpg_flow.targets import Cohort
+from cpg_flow.targets import Cohort, SequencingGroup
 from cpg_utils import Path, to_path
 from cpg_utils.config import image_path
 from cpg_utils.hail_batch import get_batch
 from hailtop.batch.job import BashJob
 from loguru import logger
 
+from single_sample_qc_popgen.constants import GCS_LISTING_WORKERS
 from single_sample_qc_popgen.utils import get_output_path, get_qc_path
 
 
+def find_dragen_csvs(sg: SequencingGroup) -> list[Path]:
+    """
+    Finds all Dragen metric CSVs for a sequencing group.
+    Errors are logged rather than raised, so one missing SG doesn't stop the others.
+    """
+    dragen_prefix = get_output_path(filename=f'dragen_metrics/{sg.name}')
+
+    try:
+        # Use rglob to find all CSV files recursively within the SG's metric directory
+        return [to_path(p) for p in dragen_prefix.rglob('*.csv')]
+    except FileNotFoundError:
+        logger.warning(f'Directory {dragen_prefix} not found when searching for Dragen CSVs.')
+    except Exception as e:  # noqa: BLE001
+        logger.error(f'Error searching for CSVs in {dragen_prefix}: {e}')
+    return []
+
+
 def run_multiqc(
     cohort: Cohort,
     outputs: dict[str, Path],
@@ -23,18 +42,10 @@ def run_multiqc(
     Gathers all required QC input paths.
     """
     # 1. Collect all individual Dragen CSV file paths
-    all_dragen_csv_paths: list[Path] = []
-    for sg in cohort.get_sequencing_groups():
-        dragen_prefix = get_output_path(filename=f'dragen_metrics/{sg.name}')
-
-        try:
-            # Use rglob to find all CSV files recursively within the SG's metric directory
-            found_paths = [to_path(p) for p in dragen_prefix.rglob('*.csv')]
-            all_dragen_csv_paths.extend(found_paths)
-        except FileNotFoundError:
-            logger.warning(f'Directory {dragen_prefix} not found when searching for Dragen CSVs.')
-        except Exception as e:  # noqa: BLE001
-            logger.error(f'Error searching for CSVs in {dragen_prefix}: {e}')
+    # Each SG's listing is a separate GCS round trip, so they are run concurrently
+    with ThreadPoolExecutor(max_workers=GCS_LISTING_WORKERS) as executor:
+        found_paths_by_sg = executor.map(find_dragen_csvs, cohort.get_sequencing_groups())
+        all_dragen_csv_paths: list[Path] = [path for found_paths in found_paths_by_sg for path in found_paths]
 
     # 2. Check if we found anything
     if not all_dragen_csv_paths:
@@ -75,7 +86,8 @@ def run_multiqc(
         f"""
         mkdir -p {local_metrics_dir}
 
-        cat {b_input_dir_resource} | xargs -P 16 -I {{}} gcloud storage cp -- {{}} {local_metrics_dir}
+        # A single gcloud process reads the paths from stdin and copies them in parallel
+        gcloud storage cp -I {local_metrics_dir} < {b_input_dir_resource}
 
         multiqc \\
         {local_metrics_dir} \\
@@ -1,7 +1,10 @@
 import json
+from functools import cache
 from typing import Any
 
 import cpg_utils
+import ijson
+import orjson
 from cloudpathlib.exceptions import CloudPathFileNotFoundError
 from cpg_flow.targets import Cohort, SequencingGroup
 from cpg_utils.config import get_driver_image, output_path
@@ -12,6 +15,12 @@ from loguru import logger
 from single_sample_qc_popgen.constants import DRAGEN_VERSION
 
 
+@cache
+def _get_driver_image() -> str:
+    """Resolves the driver image from config on first use and reuses it for every job."""
+    return get_driver_image()
+
+
 def initialise_python_job(
     job_name: str,
     target: Cohort | SequencingGroup,
@@ -24,17 +33,22 @@ def initialise_python_job(
         name=job_name,
         attributes=(target.get_job_attrs() or {}) | {'tool': tool_name},  # pyright: ignore[reportUnknownArgumentType]
     )
-    py_job.image(get_driver_image())
+    py_job.image(_get_driver_image())
     return py_job
 
 
+@cache
 def get_output_path(filename: str, category: str | None = None) -> cpg_utils.Path:
-    """Gets a path in the final 'output' directory."""
+    """
+    Gets a path in the final 'output' directory.
+    Cached, as stages ask for the same outputs repeatedly while the workflow graph is built.
+    """
     return cpg_utils.to_path(output_path(f'ica/{DRAGEN_VERSION}/output/{filename}', category=category))
 
 
+@cache
 def get_qc_path(filename: str, category: str | None = None) -> cpg_utils.Path:
-    """Gets a path in the 'qc' directory."""
+    """Gets a path in the 'qc' directory. Cached like get_output_path."""
     return cpg_utils.to_path(output_path(f'ica/{DRAGEN_VERSION}/qc/{filename}', category=category))
 
 def load_json(path: cpg_utils.Path | str, extract_key: str | None = None, allow_missing: bool = False) -> Any:
@@ -45,6 +59,10 @@ def load_json(path: cpg_utils.Path | str, extract_key: str | None = None, allow_
         path (Path | str): Path to the JSON file.
         extract_key (str, optional): If provided, only return this specific
                                      top-level key from the loaded dictionary.
+                                     The file is streamed and only this key is
+                                     materialised, which keeps memory flat for
+                                     large MultiQC reports. Keys containing '.'
+                                     are not supported.
                                      Defaults to None (returns everything).
         allow_missing (bool, optional): If True, missing files will return
                                         an empty dict instead of raising an error. Defaults to False.
@@ -60,8 +78,13 @@ def load_json(path: cpg_utils.Path | str, extract_key: str | None = None, allow_
     logger.info(f"Loading JSON data from: {path}")
 
     try:
-        with path.open() as f:
-            data = json.load(f)
+        if extract_key:
+            with path.open('rb') as f:
+                # Use next() with a default to avoid errors if the key is missing in a valid JSON
+                return next(ijson.items(f, extract_key, use_float=True), {})
+
+        with path.open('rb') as f:
+            data = orjson.loads(f.read())
     except (FileNotFoundError, CloudPathFileNotFoundError):
          if allow_missing:
             # Log a warning instead of an error and return default
@@ -70,19 +93,9 @@ def load_json(path: cpg_utils.Path | str, extract_key: str | None = None, allow_
 
          logger.error(f"JSON file not found at: {path}")
          raise
-    except json.JSONDecodeError:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    except (json.JSONDecodeError, ijson.JSONError):
          logger.error(f"Failed to decode JSON from: {path}")
          raise
 
-    if extract_key:
-        if not isinstance(data, dict):
-             logger.warning(
-                 f"Requested key '{extract_key}' cannot be extracted: "
-                 f"loaded data from {path} is not a dictionary."
-             )
-             return data
-
-        # Use .get() to avoid KeyErrors if the specific key is missing in a valid JSON
-        return data.get(extract_key, {})
-
     return data